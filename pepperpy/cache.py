@@ -3,7 +3,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 JsonDict = Dict[str, Any]
 
@@ -82,13 +82,20 @@ class Cache(ABC):
 class MemoryCache(Cache):
     """Memory cache implementation."""
 
-    def __init__(self, config: Optional[CacheConfig] = None) -> None:
+    def __init__(
+        self,
+        config: Optional[CacheConfig] = None,
+        time_source: Callable[[], datetime] = datetime.now,
+    ) -> None:
         """Initialize memory cache.
 
         Args:
             config: Cache configuration.
+            time_source: Callable returning the current time, used for
+                expiration checks.
         """
         self.config = config or CacheConfig()
+        self._time_source = time_source
         self._cache: Dict[str, CacheEntry] = {}
 
     def get(self, key: str) -> Optional[CacheEntry]:
@@ -104,7 +111,7 @@ class MemoryCache(Cache):
         if entry is None:
             return None
 
-        if entry.expires_at and entry.expires_at <= datetime.now():
+        if entry.expires_at and entry.expires_at <= self._time_source():
             del self._cache[key]
             return None
 
@@ -134,7 +141,7 @@ class MemoryCache(Cache):
             del self._cache[oldest_key]
 
         if self.config.ttl and not expires_at:
-            expires_at = datetime.now() + timedelta(seconds=self.config.ttl)
+            expires_at = self._time_source() + timedelta(seconds=self.config.ttl)
 
         entry = CacheEntry(value=value, expires_at=expires_at, metadata=metadata)
         self._cache[key] = entry
@@ -6,6 +6,10 @@ from typing import Any, Dict, Optional
 from pepperpy.core import PepperpyError
 from pepperpy.module import BaseModule, ModuleConfig
 
+# Marks an absent key so lookups need a single dict access; None is a valid
+# configuration value.
+_MISSING = object()
+
 
 class ConfigError(PepperpyError):
     """Configuration error."""
@@ -72,12 +76,13 @@ class ConfigManager(BaseModule[ConfigManagerConfig]):
             ConfigError: If value is not found
         """
         self._ensure_initialized()
-        if key not in self._config_store:
+        value = self._config_store.get(key, _MISSING)
+        if value is _MISSING:
             raise ConfigError(
                 "Configuration value not found",
                 {"key": key, "manager_name": self.config.name},
             )
-        return self._config_store[key]
+        return value
 
     def set(self, key: str, value: Any) -> None:
         """Set configuration value.
@@ -102,12 +107,11 @@ class ConfigManager(BaseModule[ConfigManagerConfig]):
             ConfigError: If value cannot be deleted
         """
         self._ensure_initialized()
-        if key not in self._config_store:
+        if self._config_store.pop(key, _MISSING) is _MISSING:
             raise ConfigError(
                 "Configuration value not found",
                 {"key": key, "manager_name": self.config.name},
             )
-        del self._config_store[key]
 
     def clear(self) -> None:
         """Clear configuration store.
@@ -20,7 +20,7 @@ class ContextError(PepperpyError):
     pass
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class State:
     """State information with metadata."""
 
@@ -34,6 +34,17 @@ T = TypeVar("T")
 class Context(Generic[T]):
     """Context class for managing context values."""
 
+    __slots__ = (
+        "name",
+        "timeout",
+        "parent",
+        "data",
+        "_context_value",
+        "_state",
+        "_cancel_event",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         name: str = "default",
@@ -56,7 +67,8 @@ class Context(Generic[T]):
         self.data = data or {}
         self._context_value: Optional[T | "Context[T]"] = None
         self._state: Optional[State] = None
-        self._cancel_event: asyncio.Event = asyncio.Event()
+        # Created on first use; most contexts are never cancelled or awaited.
+        self._cancel_event: Optional[asyncio.Event] = None
 
     def _ensure_type(self, value: Any) -> Optional[T]:
         """Ensure value is of type T.
@@ -147,9 +159,19 @@ class Context(Generic[T]):
         """
         return Context[T](name=name, parent=self)
 
+    def _get_cancel_event(self) -> asyncio.Event:
+        """Get the cancellation event, creating it if needed.
+
+        Returns:
+            Cancellation event
+        """
+        if self._cancel_event is None:
+            self._cancel_event = asyncio.Event()
+        return self._cancel_event
+
     async def cancel(self) -> None:
         """Cancel context operations."""
-        self._cancel_event.set()
+        self._get_cancel_event().set()
 
     @property
     def cancelled(self) -> bool:
@@ -158,8 +180,8 @@ class Context(Generic[T]):
         Returns:
             True if context is cancelled
         """
-        return self._cancel_event.is_set()
+        return self._cancel_event is not None and self._cancel_event.is_set()
 
     async def wait_for_cancel(self) -> None:
         """Wait for context cancellation."""
-        await self._cancel_event.wait()
+        await self._get_cancel_event().wait()
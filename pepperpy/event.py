@@ -1,6 +1,7 @@
 """Event module."""
 
 import asyncio
+import bisect
 import inspect
 from dataclasses import dataclass, field
 from typing import (
@@ -11,6 +12,7 @@ from typing import (
     List,
     Optional,
     Protocol,
+    Tuple,
     TypeVar,
     runtime_checkable,
 )
@@ -47,7 +49,7 @@ class EventError(PepperpyError):
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Event:
     """Event class."""
 
@@ -63,7 +65,7 @@ class Event:
             raise ValueError("Event name cannot be empty")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EventListener:
     """Event listener class."""
 
@@ -112,7 +114,9 @@ class EventBus(BaseModule[EventBusConfig]):
             config: Optional event bus configuration
         """
         super().__init__(config or EventBusConfig())
-        self._handlers: Dict[str, List[EventListener]] = {}
+        # Listener tuples are replaced, never mutated, so emit can dispatch from
+        # the current tuple without copying it.
+        self._handlers: Dict[str, Tuple[EventListener, ...]] = {}
         self._middleware: List[EventMiddleware] = []
         self._lock = asyncio.Lock()
         self._stats: Dict[str, int] = {"events_processed": 0}
@@ -148,12 +152,11 @@ class EventBus(BaseModule[EventBusConfig]):
             )
 
         async with self._lock:
-            if event_name not in self._handlers:
-                self._handlers[event_name] = []
+            listeners = list(self._handlers.get(event_name, ()))
 
             if (
                 self.config.max_listeners is not None
-                and len(self._handlers[event_name]) >= self.config.max_listeners
+                and len(listeners) >= self.config.max_listeners
             ):
                 raise EventError(
                     "Max listeners reached",
@@ -166,8 +169,10 @@ class EventBus(BaseModule[EventBusConfig]):
             listener = EventListener(
                 event_name=event_name, handler=handler, priority=priority
             )
-            self._handlers[event_name].append(listener)
-            self._handlers[event_name].sort(key=lambda x: x.priority, reverse=True)
+            # Listeners stay ordered by descending priority; equal priorities
+            # keep their registration order.
+            bisect.insort(listeners, listener, key=lambda x: -x.priority)
+            self._handlers[event_name] = tuple(listeners)
 
     async def remove_listener(
         self, event_name: str, handler: Callable[[Event], Awaitable[None]]
@@ -180,12 +185,14 @@ class EventBus(BaseModule[EventBusConfig]):
         """
         async with self._lock:
             if event_name in self._handlers:
-                self._handlers[event_name] = [
+                listeners = tuple(
                     listener
                     for listener in self._handlers[event_name]
                     if listener.handler != handler
-                ]
-                if not self._handlers[event_name]:
+                )
+                if listeners:
+                    self._handlers[event_name] = listeners
+                else:
                     del self._handlers[event_name]
 
     async def add_middleware(self, middleware: EventMiddleware) -> None:
@@ -211,9 +218,9 @@ class EventBus(BaseModule[EventBusConfig]):
         Args:
             event: Event to emit
         """
-        async with self._lock:
-            listeners = self._handlers.get(event.name, []).copy()
-
+        # Mutations never await while holding the lock and replace the tuple
+        # wholesale, so this read is a stable snapshot for the whole dispatch.
+        listeners = self._handlers.get(event.name)
         if not listeners:
             return
 
@@ -241,7 +248,7 @@ class EventBus(BaseModule[EventBusConfig]):
         Returns:
             List of event listeners
         """
-        return self._handlers.get(event_name, []).copy()
+        return list(self._handlers.get(event_name, ()))
 
     def get_stats(self) -> Dict[str, Any]:
         """Get event bus stats.
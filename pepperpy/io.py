@@ -1,11 +1,16 @@
 """IO module for reading and writing files."""
 
+import asyncio
 import json
 from pathlib import Path
 from typing import Protocol
 
 import aiofiles
 
+# Files above this size are parsed in a worker thread so a large document
+# does not stall the event loop; smaller ones are cheaper to parse inline.
+_THREAD_PARSE_THRESHOLD = 64 * 1024
+
 
 class IOError(Exception):
     """IO error."""
@@ -87,6 +92,11 @@ class TextFileWriter:
             raise IOError(f"Failed to write file {path}: {e}") from e
 
 
+def _normalize_json(content: bytes) -> str:
+    """Parse JSON content and serialize it back to a string."""
+    return json.dumps(json.loads(content))
+
+
 class JsonFileReader:
     """JSON file reader."""
 
@@ -103,12 +113,16 @@ class JsonFileReader:
             IOError: If file cannot be read or is not valid JSON.
         """
         try:
-            async with aiofiles.open(path, mode="r") as f:
+            # json.loads accepts bytes and detects the encoding itself, so
+            # skip the text-mode decoding layer.
+            async with aiofiles.open(path, mode="rb") as f:
                 content = await f.read()
-                return json.dumps(json.loads(content))
+            if len(content) > _THREAD_PARSE_THRESHOLD:
+                return await asyncio.to_thread(_normalize_json, content)
+            return _normalize_json(content)
         except (FileNotFoundError, PermissionError) as e:
             raise IOError(f"Failed to read file {path}: {e}") from e
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             raise IOError(f"Failed to parse JSON file {path}: {e}") from e
 
 
@@ -2,10 +2,11 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, List, Optional, Type
+from types import UnionType
+from typing import Any, Iterator, List, Optional, Tuple, Type, Union
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """Validation result."""
 
@@ -13,9 +14,48 @@ class ValidationResult:
     message: Optional[str] = None
 
 
+# Results are immutable, so every successful validation can share one instance.
+_VALID_RESULT = ValidationResult(True)
+
+
+def _type_name(type_: Any) -> str:
+    """Get a readable name for a type validation target.
+
+    Args:
+        type_: Type or other isinstance target, such as ``int | str`` or a
+            (possibly nested) tuple of targets.
+
+    Returns:
+        Class name for classes, otherwise the target's repr, so that
+        ``Union[int, str]`` is not reported as just "Union". Tuple members
+        are joined with "or"; a tuple with no members is "no type".
+    """
+    if isinstance(type_, tuple):
+        return " or ".join(map(_type_name, _flatten_types(type_))) or "no type"
+    return type_.__name__ if isinstance(type_, type) else repr(type_)
+
+
+def _flatten_types(types: Tuple[Any, ...]) -> Iterator[Any]:
+    """Yield the members of a (possibly nested) tuple of types.
+
+    Args:
+        types: Tuple of isinstance targets.
+
+    Returns:
+        Iterator over the non-tuple members, in order.
+    """
+    for member in types:
+        if isinstance(member, tuple):
+            yield from _flatten_types(member)
+        else:
+            yield member
+
+
 class BaseValidator(ABC):
     """Base validator."""
 
+    __slots__ = ()
+
     @abstractmethod
     def validate(self, value: Any) -> ValidationResult:
         """Validate value.
@@ -32,13 +72,16 @@ class BaseValidator(ABC):
 class TypeValidator(BaseValidator):
     """Type validator."""
 
-    def __init__(self, type_: Type[Any]) -> None:
+    __slots__ = ("type", "_error_template")
+
+    def __init__(self, type_: Union[Type[Any], UnionType, Tuple[Any, ...]]) -> None:
         """Initialize type validator.
 
         Args:
-            type_: Type to validate against.
+            type_: Type or tuple of types to validate against.
         """
         self.type = type_
+        self._error_template = f"Expected {_type_name(type_)}, got %s"
 
     def validate(self, value: Any) -> ValidationResult:
         """Validate value.
@@ -52,16 +95,16 @@ class TypeValidator(BaseValidator):
         Raises:
             ValueError: If value is not of the expected type.
         """
-        if not isinstance(value, self.type):
-            raise ValueError(
-                f"Expected {self.type.__name__}, got {type(value).__name__}"
-            )
-        return ValidationResult(True)
+        if type(value) is not self.type and not isinstance(value, self.type):
+            raise ValueError(self._error_template % type(value).__name__)
+        return _VALID_RESULT
 
 
 class ChainValidator(BaseValidator):
     """Chain validator."""
 
+    __slots__ = ("validators",)
+
     def __init__(self, validators: List[BaseValidator]) -> None:
         """Initialize chain validator.
 
@@ -83,10 +126,7 @@ class ChainValidator(BaseValidator):
             ValueError: If any validator fails.
         """
         for validator in self.validators:
-            try:
-                result = validator.validate(value)
-                if not result.is_valid:
-                    raise ValueError(result.message or "Validation failed")
-            except ValueError as e:
-                raise ValueError(str(e)) from e
-        return ValidationResult(True)
+            result = validator.validate(value)
+            if not result.is_valid:
+                raise ValueError(result.message or "Validation failed")
+        return _VALID_RESULT
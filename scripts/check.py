@@ -3,6 +3,7 @@
 
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple
 
 
@@ -29,21 +30,39 @@ def main() -> int:
         return exit_code
     print(stdout or "No formatting issues found.")
 
-    print("\n2. Linting (ruff check)")
-    exit_code, stdout, stderr = run_command(["ruff", "check", "."])
-    if exit_code != 0:
-        print("Linting failed:")
-        print(stderr or stdout)
-        return exit_code
-    print(stdout or "No linting issues found.")
+    # The remaining checks only read the (now formatted) sources, so they run
+    # side by side. Results are still reported in a fixed order.
+    checks = [
+        (
+            "2. Linting (ruff check)",
+            "Linting",
+            ["ruff", "check", "."],
+            "No linting issues found.",
+        ),
+        (
+            "3. Type checking (mypy)",
+            "Type checking",
+            ["mypy", ".", "--exclude", "scripts/"],
+            "No type checking issues found.",
+        ),
+        ("4. Tests (pytest)", "Tests", ["pytest", "-q"], "All tests passed."),
+    ]
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        outputs = list(executor.map(run_command, [cmd for _, _, cmd, _ in checks]))
 
-    print("\n3. Type checking (mypy)")
-    exit_code, stdout, stderr = run_command(["mypy", ".", "--exclude", "scripts/"])
-    if exit_code != 0:
-        print("Type checking failed:")
-        print(stderr or stdout)
-        return exit_code
-    print(stdout or "No type checking issues found.")
+    result = 0
+    for (title, name, _, success), output in zip(checks, outputs, strict=True):
+        exit_code, stdout, stderr = output
+        print(f"\n{title}")
+        if exit_code != 0:
+            print(f"{name} failed:")
+            print(stderr or stdout)
+            result = result or exit_code
+            continue
+        print(stdout or success)
+
+    if result != 0:
+        return result
 
     print("\nAll checks passed successfully!")
     return 0
@@ -0,0 +1,45 @@
+"""Test configuration manager."""
+
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+
+from pepperpy.config import ConfigError, ConfigManager
+
+
+@pytest_asyncio.fixture
+async def config_manager() -> AsyncGenerator[ConfigManager, None]:
+    """Create a configuration manager."""
+    manager = ConfigManager()
+    await manager.initialize()
+    yield manager
+    await manager.teardown()
+
+
+def test_config_set_get(config_manager: ConfigManager) -> None:
+    """Test setting and getting values."""
+    config_manager.set("key", "value")
+    assert config_manager.get("key") == "value"
+
+
+def test_config_get_none_value(config_manager: ConfigManager) -> None:
+    """Test None is a valid stored value."""
+    config_manager.set("key", None)
+    assert config_manager.get("key") is None
+
+
+def test_config_get_not_found(config_manager: ConfigManager) -> None:
+    """Test getting a missing value."""
+    with pytest.raises(ConfigError, match="Configuration value not found"):
+        config_manager.get("missing")
+
+
+def test_config_delete(config_manager: ConfigManager) -> None:
+    """Test deleting values."""
+    config_manager.set("key", "value")
+    config_manager.delete("key")
+    with pytest.raises(ConfigError):
+        config_manager.get("key")
+    with pytest.raises(ConfigError, match="Configuration value not found"):
+        config_manager.delete("key")
@@ -0,0 +1,70 @@
+"""Test cache module."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from pepperpy.cache import CacheConfig, MemoryCache
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        """Initialize clock."""
+        self.now = datetime(2024, 1, 1)
+
+    def __call__(self) -> datetime:
+        """Return the current time."""
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward."""
+        self.now += timedelta(seconds=seconds)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Create a fake clock."""
+    return FakeClock()
+
+
+def test_cache_set_get() -> None:
+    """Test setting and getting values."""
+    cache = MemoryCache()
+    cache.set("key", "value")
+    entry = cache.get("key")
+    assert entry is not None
+    assert entry.value == "value"
+    assert cache.get("missing") is None
+
+
+def test_cache_ttl_expiration(clock: FakeClock) -> None:
+    """Test entries expire after the configured TTL."""
+    cache = MemoryCache(CacheConfig(ttl=1), time_source=clock)
+    cache.set("key", "value")
+    assert cache.get("key") is not None
+
+    clock.advance(1.1)
+    assert cache.get("key") is None
+
+
+def test_cache_explicit_expiration(clock: FakeClock) -> None:
+    """Test entries expire at an explicit time."""
+    cache = MemoryCache(time_source=clock)
+    cache.set("key", "value", expires_at=clock.now + timedelta(seconds=5))
+
+    clock.advance(4)
+    assert cache.get("key") is not None
+    clock.advance(1)
+    assert cache.get("key") is None
+
+
+def test_cache_max_size() -> None:
+    """Test oldest entry is evicted when full."""
+    cache = MemoryCache(CacheConfig(max_size=2))
+    cache.set("test1", "value1")
+    cache.set("test2", "value2")
+    cache.set("test3", "value3")
+    assert cache.get("test1") is None
+    assert cache.get("test3") is not None
@@ -0,0 +1,61 @@
+"""Test context module."""
+
+import asyncio
+import weakref
+
+from pepperpy.context import Context, State
+
+
+def test_context_data() -> None:
+    """Test getting and setting context data."""
+    context = Context[int]("test", data={"a": 1})
+    context.set("b", 2)
+    assert context.get("a") == 1
+    assert context.get("b") == 2
+    assert context.get("missing", 3) == 3
+
+
+def test_context_state() -> None:
+    """Test context state."""
+    context = Context[int]()
+    assert context.get_state() is None
+    context.set_state("running", step=1)
+    state = context.get_state()
+    assert state == State(value="running", metadata={"step": 1})
+
+
+def test_context_chain() -> None:
+    """Test chained contexts keep their parent."""
+    parent = Context[int]("parent")
+    child = parent.chain("child")
+    assert child.name == "child"
+    assert child.parent is parent
+    assert not child.cancelled
+
+
+def test_context_slots() -> None:
+    """Test context and state do not carry an instance dict."""
+    context: Context[int] = Context()
+    state = State(value=None)
+    assert not hasattr(context, "__dict__")
+    assert not hasattr(state, "__dict__")
+    assert weakref.ref(context)() is context
+    assert weakref.ref(state)() is state
+
+
+async def test_context_cancel() -> None:
+    """Test context cancellation."""
+    context = Context[int]()
+    await context.cancel()
+    assert context.cancelled
+    await context.wait_for_cancel()
+
+
+async def test_context_wait_before_cancel() -> None:
+    """Test waiting on a context that is cancelled later."""
+    context = Context[int]()
+    waiter = asyncio.create_task(context.wait_for_cancel())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    await context.cancel()
+    await asyncio.wait_for(waiter, timeout=1)
@@ -0,0 +1,124 @@
+"""Test event module."""
+
+from dataclasses import FrozenInstanceError
+from typing import AsyncGenerator, List
+
+import pytest
+import pytest_asyncio
+
+from pepperpy.event import Event, EventBus, EventBusConfig, EventError
+
+
+@pytest_asyncio.fixture
+async def event_bus() -> AsyncGenerator[EventBus, None]:
+    """Create an event bus."""
+    bus = EventBus()
+    await bus.initialize()
+    yield bus
+    await bus.teardown()
+
+
+async def test_listeners_ordered_by_priority(event_bus: EventBus) -> None:
+    """Test listeners are ordered by priority, then registration order."""
+
+    async def low(event: Event) -> None:
+        pass
+
+    async def high(event: Event) -> None:
+        pass
+
+    async def normal_first(event: Event) -> None:
+        pass
+
+    async def normal_second(event: Event) -> None:
+        pass
+
+    await event_bus.add_listener("test", low, priority=-1)
+    await event_bus.add_listener("test", normal_first)
+    await event_bus.add_listener("test", high, priority=10)
+    await event_bus.add_listener("test", normal_second)
+
+    handlers = [listener.handler for listener in event_bus.get_listeners("test")]
+    assert handlers == [high, normal_first, normal_second, low]
+
+
+async def test_emit_calls_listeners(event_bus: EventBus) -> None:
+    """Test emit calls every listener for the event."""
+    received: List[str] = []
+
+    async def handler(event: Event) -> None:
+        received.append(event.data)
+
+    await event_bus.add_listener("test", handler)
+    await event_bus.emit(Event(name="test", data="payload"))
+    await event_bus.emit(Event(name="other", data="ignored"))
+
+    assert received == ["payload"]
+    assert event_bus.get_stats()["events_processed"] == 1
+
+
+def test_event_uses_slots() -> None:
+    """Test events do not carry an instance dict."""
+    event = Event(name="test")
+    assert not hasattr(event, "__dict__")
+
+
+def test_event_is_immutable() -> None:
+    """Test event fields cannot be reassigned."""
+    event = Event(name="test", data="payload")
+    with pytest.raises(FrozenInstanceError):
+        event.data = "changed"  # type: ignore[misc]
+    event.metadata["key"] = "value"
+    assert event.metadata == {"key": "value"}
+
+
+async def test_emit_without_listeners_skips_middleware(event_bus: EventBus) -> None:
+    """Test emit returns early when nothing listens to the event."""
+    seen: List[str] = []
+
+    class Middleware:
+        async def before_event(self, event: Event) -> None:
+            seen.append("before")
+
+        async def after_event(self, event: Event) -> None:
+            seen.append("after")
+
+    await event_bus.add_middleware(Middleware())
+    await event_bus.emit(Event(name="test"))
+
+    assert seen == []
+    assert event_bus.get_stats()["events_processed"] == 0
+
+
+async def test_remove_listener(event_bus: EventBus) -> None:
+    """Test removing listeners."""
+
+    async def first(event: Event) -> None:
+        pass
+
+    async def second(event: Event) -> None:
+        pass
+
+    await event_bus.add_listener("test", first)
+    await event_bus.add_listener("test", second)
+    await event_bus.remove_listener("test", first)
+    assert [listener.handler for listener in event_bus.get_listeners("test")] == [
+        second
+    ]
+
+    await event_bus.remove_listener("test", second)
+    assert event_bus.get_listeners("test") == []
+
+
+async def test_max_listeners() -> None:
+    """Test max listeners limit."""
+    bus = EventBus(EventBusConfig(max_listeners=1))
+    await bus.initialize()
+
+    async def handler(event: Event) -> None:
+        pass
+
+    await bus.add_listener("test", handler)
+    with pytest.raises(EventError):
+        await bus.add_listener("test", handler)
+    assert len(bus.get_listeners("test")) == 1
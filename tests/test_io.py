@@ -0,0 +1,60 @@
+"""Test IO module."""
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from pepperpy.io import _THREAD_PARSE_THRESHOLD, IOError, JsonFileReader
+
+
+async def test_json_reader_utf8(tmp_path: Path) -> None:
+    """Test reading a UTF-8 JSON file."""
+    path = tmp_path / "data.json"
+    path.write_text('{"name": "café"}', encoding="utf-8")
+    assert await JsonFileReader().read(path) == '{"name": "caf\\u00e9"}'
+
+
+async def test_json_reader_invalid_utf8(tmp_path: Path) -> None:
+    """Test invalid UTF-8 content is reported as an IO error."""
+    path = tmp_path / "data.json"
+    path.write_bytes(b'{"name": "\xff"}')
+    with pytest.raises(IOError, match="Failed to parse JSON file"):
+        await JsonFileReader().read(path)
+
+
+async def test_json_reader_small_file(tmp_path: Path) -> None:
+    """Test a small file is parsed inline."""
+    path = tmp_path / "small.json"
+    path.write_text('{"key": "value"}')
+    with patch("pepperpy.io.asyncio.to_thread") as to_thread:
+        assert await JsonFileReader().read(path) == '{"key": "value"}'
+    to_thread.assert_not_called()
+
+
+async def test_json_reader_large_file(tmp_path: Path) -> None:
+    """Test a file above the threshold is parsed in a worker thread."""
+    data = {"key": "x" * _THREAD_PARSE_THRESHOLD}
+    path = tmp_path / "large.json"
+    path.write_text(json.dumps(data))
+    with patch("pepperpy.io.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+        content = await JsonFileReader().read(path)
+    to_thread.assert_called_once()
+    assert json.loads(content) == data
+
+
+async def test_json_reader_large_invalid_file(tmp_path: Path) -> None:
+    """Test parse errors from the worker thread are reported as IO errors."""
+    path = tmp_path / "large.json"
+    path.write_text('{"key": ' + " " * _THREAD_PARSE_THRESHOLD)
+    with pytest.raises(IOError, match="Failed to parse JSON file") as exc_info:
+        await JsonFileReader().read(path)
+    assert isinstance(exc_info.value.__cause__, json.JSONDecodeError)
+
+
+async def test_json_reader_missing_file(tmp_path: Path) -> None:
+    """Test reading a missing file."""
+    with pytest.raises(IOError, match="Failed to read file"):
+        await JsonFileReader().read(tmp_path / "missing.json")
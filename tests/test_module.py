@@ -38,7 +38,6 @@ def test_module(test_config: TestConfig) -> TestModule:
     return TestModule(test_config)
 
 
-@pytest.mark.asyncio
 async def test_module_init(test_config: TestConfig) -> None:
     """Test module initialization."""
     module = TestModule(test_config)
@@ -46,21 +45,18 @@ async def test_module_init(test_config: TestConfig) -> None:
     assert not module.is_initialized
 
 
-@pytest.mark.asyncio
 async def test_module_init_with_invalid_name() -> None:
     """Test module initialization with invalid name."""
     with pytest.raises(ValueError):
         TestModule(TestConfig(name=""))
 
 
-@pytest.mark.asyncio
 async def test_module_initialize(test_module: TestModule) -> None:
     """Test module initialization."""
     await test_module.initialize()
     assert test_module.is_initialized
 
 
-@pytest.mark.asyncio
 async def test_module_initialize_twice(test_module: TestModule) -> None:
     """Test module initialization twice."""
     await test_module.initialize()
@@ -68,7 +64,6 @@ async def test_module_initialize_twice(test_module: TestModule) -> None:
     assert test_module.is_initialized
 
 
-@pytest.mark.asyncio
 async def test_module_teardown(test_module: TestModule) -> None:
     """Test module teardown."""
     await test_module.initialize()
@@ -76,7 +71,6 @@ async def test_module_teardown(test_module: TestModule) -> None:
     assert not test_module.is_initialized
 
 
-@pytest.mark.asyncio
 async def test_module_teardown_twice(test_module: TestModule) -> None:
     """Test module teardown twice."""
     await test_module.initialize()
@@ -1,8 +1,9 @@
 """Test registry module."""
 
-from typing import Any, Dict
+from typing import Any, AsyncGenerator, Dict
 
 import pytest
+import pytest_asyncio
 
 from pepperpy.registry import Registry, RegistryError, RegistryProtocol
 
@@ -57,15 +58,15 @@ class InvalidImplementation:
     pass
 
 
-@pytest.fixture
-async def test_registry() -> Registry[TestProtocol]:
+@pytest_asyncio.fixture
+async def test_registry() -> AsyncGenerator[Registry[TestProtocol], None]:
     """Create a test registry."""
     registry = Registry[TestProtocol]()
     await registry.initialize()
-    return registry
+    yield registry
+    await registry.teardown()
 
 
-@pytest.mark.asyncio
 async def test_register_implementation(test_registry: Registry[TestProtocol]) -> None:
     """Test register implementation."""
     impl = TestImplementation()
@@ -73,7 +74,6 @@ async def test_register_implementation(test_registry: Registry[TestProtocol]) ->
     assert "test" in test_registry.list()
 
 
-@pytest.mark.asyncio
 async def test_register_duplicate_implementation(
     test_registry: Registry[TestProtocol],
 ) -> None:
@@ -84,7 +84,6 @@ async def test_register_duplicate_implementation(
         test_registry.register("test", impl)
 
 
-@pytest.mark.asyncio
 async def test_get_implementation(test_registry: Registry[TestProtocol]) -> None:
     """Test get implementation."""
     impl = TestImplementation()
@@ -92,7 +91,6 @@ async def test_get_implementation(test_registry: Registry[TestProtocol]) -> None
     assert test_registry.get("test") is impl
 
 
-@pytest.mark.asyncio
 async def test_get_invalid_implementation(
     test_registry: Registry[TestProtocol],
 ) -> None:
@@ -101,7 +99,6 @@ async def test_get_invalid_implementation(
         test_registry.get("test")
 
 
-@pytest.mark.asyncio
 async def test_list_implementations(test_registry: Registry[TestProtocol]) -> None:
     """Test list implementations."""
     impl1 = TestImplementation()
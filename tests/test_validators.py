@@ -1,10 +1,12 @@
 """Test validators module."""
 
-from typing import Any, Sequence
+from dataclasses import FrozenInstanceError
+from typing import Any, Optional, Sequence, Union
 
 import pytest
 
 from pepperpy.validators import (
+    BaseValidator,
     ChainValidator,
     TypeValidator,
     ValidationResult,
@@ -213,3 +215,141 @@ def test_chain_validator_invalid() -> None:
     validator = ChainValidator([TypeValidator(str), TransformValidator(transform)])
     with pytest.raises(ValueError):
         validator.validate(123)
+
+
+def test_validation_result_is_immutable() -> None:
+    """Test validation results cannot be mutated."""
+    result = TypeValidator(str).validate("test")
+    with pytest.raises(FrozenInstanceError):
+        result.is_valid = False  # type: ignore[misc]
+
+
+def test_validators_share_success_result() -> None:
+    """Test successful validations reuse a single result."""
+    first = TypeValidator(str).validate("test")
+    second = ChainValidator([TypeValidator(int)]).validate(1)
+    assert first is second
+    assert first == ValidationResult(True)
+
+
+def test_type_validator_error_message() -> None:
+    """Test type validator error message."""
+    validator = TypeValidator(str)
+    with pytest.raises(ValueError, match="^Expected str, got int$"):
+        validator.validate(123)
+
+
+def test_validation_result_uses_slots() -> None:
+    """Test validation results do not carry an instance dict."""
+    result = ValidationResult(False, "invalid")
+    assert not hasattr(result, "__dict__")
+    assert result.message == "invalid"
+
+
+class RejectValidator(BaseValidator):
+    """Validator that returns an invalid result."""
+
+    def __init__(self) -> None:
+        """Initialize reject validator."""
+        self.calls = 0
+
+    def validate(self, value: Any) -> ValidationResult:
+        """Validate value."""
+        self.calls += 1
+        return ValidationResult(False, "rejected")
+
+
+def test_chain_validator_invalid_result() -> None:
+    """Test chain validator stops at the first invalid result."""
+    first = RejectValidator()
+    second = RejectValidator()
+    validator = ChainValidator([first, second])
+    with pytest.raises(ValueError, match="^rejected$"):
+        validator.validate("test")
+    assert first.calls == 1
+    assert second.calls == 0
+
+
+def test_chain_validator_propagates_error() -> None:
+    """Test chain validator propagates validator errors unchanged."""
+    validator = ChainValidator([TypeValidator(str)])
+    with pytest.raises(ValueError, match="^Expected str, got int$") as exc_info:
+        validator.validate(123)
+    assert exc_info.value.__cause__ is None
+
+
+def test_type_validator_tuple() -> None:
+    """Test type validator with a tuple of types."""
+    validator = TypeValidator((int, float))
+    assert validator.validate(1).is_valid
+    assert validator.validate(1.5).is_valid
+    with pytest.raises(ValueError, match="^Expected int or float, got str$"):
+        validator.validate("1")
+
+
+def test_validators_use_slots() -> None:
+    """Test built-in validators do not carry an instance dict."""
+    assert not hasattr(TypeValidator(str), "__dict__")
+    assert not hasattr(ChainValidator([]), "__dict__")
+
+
+def test_type_validator_accepts_subclass() -> None:
+    """Test type validator accepts instances of subclasses."""
+    assert TypeValidator(int).validate(True).is_valid
+
+
+def test_type_validator_union_type() -> None:
+    """Test type validator with a union type."""
+    validator = TypeValidator(int | str)
+    assert validator.validate(1).is_valid
+    assert validator.validate("1").is_valid
+    with pytest.raises(ValueError, match=r"^Expected int \| str, got float$"):
+        validator.validate(1.5)
+
+
+def test_type_validator_typing_union() -> None:
+    """Test type validator with a typing.Union target."""
+    validator = TypeValidator(Union[int, str])  # type: ignore[arg-type]
+    assert validator.validate("1").is_valid
+    with pytest.raises(
+        ValueError, match=r"^Expected typing\.Union\[int, str\], got float$"
+    ):
+        validator.validate(1.5)
+
+
+def test_type_validator_tuple_with_union_and_nested_types() -> None:
+    """Test type validator with union and nested tuple members."""
+    validator = TypeValidator((int, str | None))
+    assert validator.validate(None).is_valid
+    with pytest.raises(ValueError, match=r"^Expected int or str \| None, got float$"):
+        validator.validate(1.5)
+
+    nested = TypeValidator((int, (str, bytes)))
+    assert nested.validate(b"1").is_valid
+    with pytest.raises(ValueError, match="^Expected int or str or bytes, got float$"):
+        nested.validate(1.5)
+
+
+def test_type_validator_tuple_with_typing_unions() -> None:
+    """Test type validator with typing.Optional and typing.Union members."""
+    validator = TypeValidator((int, Optional[str]))
+    assert validator.validate(None).is_valid
+    with pytest.raises(
+        ValueError, match=r"^Expected int or typing\.Optional\[str\], got float$"
+    ):
+        validator.validate(1.5)
+
+    union = TypeValidator((Union[int, str], bytes))
+    assert union.validate(b"1").is_valid
+    with pytest.raises(
+        ValueError, match=r"^Expected typing\.Union\[int, str\] or bytes, got float$"
+    ):
+        union.validate(1.5)
+
+
+def test_type_validator_empty_tuple() -> None:
+    """Test type validator with an empty tuple of types."""
+    with pytest.raises(ValueError, match="^Expected no type, got float$"):
+        TypeValidator(()).validate(1.5)
+    with pytest.raises(ValueError, match="^Expected int, got float$"):
+        TypeValidator((int, ())).validate(1.5)
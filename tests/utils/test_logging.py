@@ -60,35 +60,14 @@ class TestLoggerMixin:
             logging.INFO, "test message", extra={"key": "value"}
         )
 
-    def test_debug(self, mixin: LoggerMixin, logger_mock: MagicMock) -> None:
-        """Test debug method."""
-        mixin.debug("test message", extra={"key": "value"})
-        logger_mock.debug.assert_called_once_with(
-            "test message", extra={"key": "value"}
-        )
-
-    def test_info(self, mixin: LoggerMixin, logger_mock: MagicMock) -> None:
-        """Test info method."""
-        mixin.info("test message", extra={"key": "value"})
-        logger_mock.info.assert_called_once_with("test message", extra={"key": "value"})
-
-    def test_warning(self, mixin: LoggerMixin, logger_mock: MagicMock) -> None:
-        """Test warning method."""
-        mixin.warning("test message", extra={"key": "value"})
-        logger_mock.warning.assert_called_once_with(
-            "test message", extra={"key": "value"}
-        )
-
-    def test_error(self, mixin: LoggerMixin, logger_mock: MagicMock) -> None:
-        """Test error method."""
-        mixin.error("test message", extra={"key": "value"})
-        logger_mock.error.assert_called_once_with(
-            "test message", extra={"key": "value"}
-        )
-
-    def test_critical(self, mixin: LoggerMixin, logger_mock: MagicMock) -> None:
-        """Test critical method."""
-        mixin.critical("test message", extra={"key": "value"})
-        logger_mock.critical.assert_called_once_with(
+    @pytest.mark.parametrize(
+        "method", ["debug", "info", "warning", "error", "critical"]
+    )
+    def test_level_methods(
+        self, mixin: LoggerMixin, logger_mock: MagicMock, method: str
+    ) -> None:
+        """Test level-specific logging methods."""
+        getattr(mixin, method)("test message", extra={"key": "value"})
+        getattr(logger_mock, method).assert_called_once_with(
             "test message", extra={"key": "value"}
         )